@@ -0,0 +1,90 @@
+"""Profile the per-tick update path of BoschDataServer without a live server.
+
+At BATCH_SIZE=10 a tick moves ~240 bytes of vibration data, so the hot
+path is interpreter overhead (Variant/DataValue construction, asyncua's
+encoder, the awaits) rather than memory bandwidth. This harness runs
+update_vibration_data in a tight loop (no sleep, no network) under
+cProfile so that claim can be re-checked whenever the tick path changes:
+the top frames should sit in asyncua's write/encode machinery and the
+batch-to-list conversion, not in numpy bulk copies.
+
+Run from the repo root:  python benchmarks/profile_tick.py [ticks]
+"""
+
+import asyncio
+import cProfile
+import os
+import pstats
+import sys
+import time
+
+import numpy as np
+from asyncua import ua
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import BoschDataServer as bds
+
+TOTAL_SAMPLES = 100_000
+
+
+class _NullServer:
+    """Stands in for asyncua's Server; accepts writes and discards them."""
+
+    async def write_attribute_value(self, nodeid, datavalue):
+        pass
+
+
+def _setup_state():
+    """Populate BoschDataServer's module state as setup_vibration_streaming
+    would, but against synthetic data and without an address space."""
+    rng = np.random.default_rng(0)
+    bds.vibration_data = rng.random((3, TOTAL_SAMPLES), dtype=np.float32)
+    bds.wrap_buffer = np.empty((3, bds.BATCH_SIZE), dtype=np.float32)
+    bds.opc_server = _NullServer()
+    bds.current_sample_index = 0
+
+    names = ('VibrationXBatch', 'VibrationYBatch', 'VibrationZBatch',
+             'VibrationXBatchBytes', 'VibrationYBatchBytes', 'VibrationZBatchBytes',
+             'CurrentSampleIndex', 'Timestamp')
+    for name in names[:3]:
+        bds.vibration_variants[name] = ua.Variant([0.0] * bds.BATCH_SIZE, ua.VariantType.Float)
+    for name in names[3:6]:
+        bds.vibration_variants[name] = ua.Variant(b'', ua.VariantType.ByteString)
+    bds.vibration_variants['CurrentSampleIndex'] = ua.Variant(0, ua.VariantType.Int64)
+    bds.vibration_variants['Timestamp'] = ua.Variant(0.0, ua.VariantType.Double)
+
+    bds.update_write_refs = tuple(
+        (ua.NodeId(i, 2), bds.vibration_variants[name])
+        for i, name in enumerate(names)
+    )
+    # Keep the guard in update_vibration_data satisfied
+    bds.vibration_vars['TotalSamples'] = object()
+
+
+async def _run_ticks(n):
+    for _ in range(n):
+        await bds.update_vibration_data()
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    _setup_state()
+
+    # Silence the sampled progress prints; they are not part of the tick cost
+    bds.print = lambda *a, **k: None
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    asyncio.run(_run_ticks(ticks))
+    profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    print(f"{ticks} ticks in {elapsed:.3f}s -> {ticks / elapsed:,.0f} ticks/s, "
+          f"{elapsed / ticks * 1e6:.1f} us/tick")
+    stats = pstats.Stats(profiler)
+    stats.sort_stats('cumulative').print_stats(20)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,39 @@ Git-Enhanced Data Sidecar Container
 - Automatic data loading from remote git repository
 """
 
+import json
 import os
 import shutil
+import signal
 import time
 import logging
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # non-Linux development environments
+    INotify = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _iter_h5(root):
+    """Yield paths of .h5 files under root via a scandir walk.
+
+    Lazy, so callers that only need to know whether any file exists stop
+    after the first hit; DirEntry type checks reuse the stat info from the
+    directory read instead of issuing one stat() per file like os.walk.
+    """
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_h5(entry.path)
+        elif entry.name.endswith('.h5'):
+            yield entry.path
+
+
 class GitDataSidecar:
     def __init__(self, shared_data_path: str = "/shared-data", git_repo_url: str = None):
         self.shared_data_path = shared_data_path
@@ -25,54 +48,89 @@ class GitDataSidecar:
         # Configuration based on TechSpikeDataPipeline.md requirements
         self.included_machines = ["M01", "M02"]  # Exclude M03
         self.excluded_operations = ["OP00", "OP06", "OP09", "OP13"]
+        # frozenset for the per-entry membership test in the copy loop
+        self._excluded = frozenset(self.excluded_operations)
+
+        # Seconds between incremental git resyncs; 0 disables resync and the
+        # clone is deleted after the initial copy as before
+        self.resync_interval = int(os.getenv("DATA_RESYNC_INTERVAL", "0"))
         
         # Ensure shared directory exists
         os.makedirs(shared_data_path, exist_ok=True)
+
+        # (count, {machine: mtime_ns}) from the last full walk
+        self._count_cache = None
         
     def check_existing_data(self) -> bool:
         """Check if data already exists in shared volume"""
         try:
-            # Check if we have machine directories with H5 files
+            # Check if we have machine directories with H5 files; the lazy
+            # walk stops at the first hit instead of listing the whole tree
             for machine in self.included_machines:
                 machine_path = os.path.join(self.shared_data_path, machine)
                 if os.path.exists(machine_path):
-                    # Look for any .h5 files
-                    for root, dirs, files in os.walk(machine_path):
-                        if any(f.endswith('.h5') for f in files):
-                            logger.info(f"Found existing data in {machine_path}")
-                            return True
-            
+                    if next(_iter_h5(machine_path), None) is not None:
+                        logger.info(f"Found existing data in {machine_path}")
+                        return True
+
             logger.info("No existing data found in shared volume")
             return False
         except Exception as e:
             logger.error(f"Error checking existing data: {e}")
             return False
     
+    def _sparse_checkout_paths(self):
+        """Repo paths to materialize: included machines minus excluded operations.
+
+        The data set covers OP00-OP14 per TechSpikeDataPipeline.md.
+        """
+        operations = [f"OP{i:02d}" for i in range(15)]
+        return [
+            f"data/{machine}/{operation}"
+            for machine in self.included_machines
+            for operation in operations
+            if operation not in self.excluded_operations
+        ]
+
     def clone_data_repository(self) -> bool:
         """Clone data from git repository"""
         if not self.git_repo_url:
             logger.error("No git repository URL provided. Set DATA_GIT_REPO_URL environment variable.")
             return False
-            
+
         logger.info(f"Cloning data from git repository: {self.git_repo_url}")
-        
+
         try:
-            # Remove existing clone if present
-            if os.path.exists(self.git_clone_path):
-                shutil.rmtree(self.git_clone_path)
-            
-            # Clone the repository
+            # Remove any existing clone; ignore_errors covers the missing
+            # case without a separate (racy) existence probe
+            shutil.rmtree(self.git_clone_path, ignore_errors=True)
+
+            # Partial + sparse clone: --filter=blob:none makes the server send
+            # only commit/tree objects up front, --sparse checks out nothing;
+            # the sparse-checkout set below then fetches and materializes just
+            # the wanted machine/operation paths, so excluded data (all of
+            # M03, the excluded operations) never crosses the network
             result = subprocess.run([
-                "git", "clone", "--depth", "1", self.git_repo_url, self.git_clone_path
+                "git", "clone", "--depth", "1", "--filter=blob:none", "--sparse",
+                self.git_repo_url, self.git_clone_path
             ], capture_output=True, text=True, timeout=300)
-            
+
             if result.returncode != 0:
                 logger.error(f"Git clone failed: {result.stderr}")
                 return False
-                
+
+            result = subprocess.run(
+                ["git", "-C", self.git_clone_path, "sparse-checkout", "set"]
+                + self._sparse_checkout_paths(),
+                capture_output=True, text=True, timeout=300)
+
+            if result.returncode != 0:
+                logger.error(f"Git sparse-checkout failed: {result.stderr}")
+                return False
+
             logger.info(f"Successfully cloned data repository to {self.git_clone_path}")
             return True
-            
+
         except subprocess.TimeoutExpired:
             logger.error("Git clone timed out after 5 minutes")
             return False
@@ -89,93 +147,403 @@ class GitDataSidecar:
                 return 0
             
             logger.info(f"Copying filtered data from git clone to shared volume...")
-            
-            total_files = 0
-            
+
+            # When the clone and the shared volume sit on the same filesystem
+            # the files can be hardlinked instead of copied; the clone is
+            # deleted right afterwards, so each transfer becomes a
+            # metadata-only operation instead of moving every byte
+            same_fs = (os.stat(self.git_clone_path).st_dev
+                       == os.stat(self.shared_data_path).st_dev)
+            if same_fs:
+                logger.info("Clone and shared volume share a filesystem - using hardlinks")
+
+            # First pass: collect every (source, target) pair plus the set of
+            # target directories, so the transfer workers below never race
+            # on os.makedirs
+            transfers = []
+            dirs_to_create = set()
+
             for machine in self.included_machines:
                 source_machine_path = os.path.join(self.git_clone_path, "data", machine)
                 target_machine_path = os.path.join(self.shared_data_path, machine)
-                
+
                 if not os.path.exists(source_machine_path):
                     logger.warning(f"Source machine directory not found in git repo: {source_machine_path}")
                     continue
-                    
+
                 logger.info(f"Processing {machine} from git repository...")
-                
+
                 # Get operation directories, excluding specified ones
                 try:
-                    operations = [d for d in os.listdir(source_machine_path) 
-                                 if d.startswith("OP") and d not in self.excluded_operations and 
-                                 os.path.isdir(os.path.join(source_machine_path, d))]
+                    # scandir's DirEntry.is_dir reuses the type readdir()
+                    # already returned, so no extra stat per entry
+                    operations = [e.name for e in os.scandir(source_machine_path)
+                                 if e.name.startswith("OP") and e.name not in self._excluded and
+                                 e.is_dir(follow_symlinks=False)]
                     logger.info(f"Found operations for {machine}: {operations}")
                 except Exception as e:
                     logger.error(f"Error reading machine directory {source_machine_path}: {e}")
                     continue
-                    
+
                 for operation in operations:
                     source_op_path = os.path.join(source_machine_path, operation)
                     target_op_path = os.path.join(target_machine_path, operation)
-                    
+
                     # Copy good and bad directories
                     for quality in ["good", "bad"]:
                         source_quality_path = os.path.join(source_op_path, quality)
                         target_quality_path = os.path.join(target_op_path, quality)
-                        
+
                         if os.path.exists(source_quality_path):
-                            os.makedirs(target_quality_path, exist_ok=True)
-                            
-                            # Copy all H5 files
+                            dirs_to_create.add(target_quality_path)
+
                             try:
                                 h5_files = [f for f in os.listdir(source_quality_path) if f.endswith('.h5')]
+                                # Join the directory part once per quality dir;
+                                # inside the loop a plain concatenation skips
+                                # os.path.join's per-call normalization
+                                source_prefix = source_quality_path + os.sep
+                                target_prefix = target_quality_path + os.sep
                                 for h5_file in h5_files:
-                                    source_file = os.path.join(source_quality_path, h5_file)
-                                    target_file = os.path.join(target_quality_path, h5_file)
-                                    
-                                    try:
-                                        shutil.copy2(source_file, target_file)
-                                        total_files += 1
-                                    except Exception as e:
-                                        logger.error(f"Failed to copy {source_file}: {e}")
-                                
+                                    transfers.append((
+                                        source_prefix + h5_file,
+                                        target_prefix + h5_file,
+                                        machine, operation, quality, h5_file,
+                                    ))
                                 if h5_files:
-                                    logger.info(f"Copied {len(h5_files)} files from {machine}/{operation}/{quality}")
+                                    logger.info(f"Queued {len(h5_files)} files from {machine}/{operation}/{quality}")
                             except Exception as e:
                                 logger.error(f"Error processing quality directory {source_quality_path}: {e}")
                         else:
                             logger.debug(f"Quality directory does not exist: {source_quality_path}")
-                            
+
+            # Create each target directory exactly once, parents before
+            # children (lexicographic order puts prefixes first), so makedirs
+            # never re-walks components the previous call just created
+            for directory in sorted(dirs_to_create):
+                os.makedirs(directory, exist_ok=True)
+
+            # Second pass: move the bytes. Across filesystems a single tar
+            # pipe streams the whole batch in one fork/exec pair; otherwise
+            # (or if tar fails) the transfers run on a thread pool - copies
+            # release the GIL inside read/write, so the syscalls overlap
+            total_files = 0
+            manifest_entries = []
+            if not same_fs and len(transfers) > 1 and self._bulk_copy_tar(transfers):
+                for src, dst, machine, operation, quality, h5_file in transfers:
+                    if os.path.exists(dst):
+                        total_files += 1
+                        manifest_entries.append({
+                            'path': dst,
+                            'filename': h5_file,
+                            'machine': machine,
+                            'operation': operation,
+                            'quality': quality,
+                            'size': os.path.getsize(dst),
+                        })
+                    else:
+                        logger.error(f"File missing after tar copy: {dst}")
+            else:
+                max_workers = min(32, (os.cpu_count() or 1) * 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(self._transfer_file, t[0], t[1], same_fs): t
+                        for t in transfers
+                    }
+                    for future in as_completed(futures):
+                        src, dst, machine, operation, quality, h5_file = futures[future]
+                        try:
+                            future.result()
+                            total_files += 1
+                            manifest_entries.append({
+                                'path': dst,
+                                'filename': h5_file,
+                                'machine': machine,
+                                'operation': operation,
+                                'quality': quality,
+                                'size': os.path.getsize(dst),
+                            })
+                        except Exception as e:
+                            logger.error(f"Failed to copy {src}: {e}")
+
             logger.info(f"Git data copy complete - total files copied: {total_files}")
-            
-            # Clean up git clone to save space
-            self.cleanup_git_clone()
-            
+
+            # Write the manifest before .ready so the server never sees the
+            # ready marker without the file list it promises
+            self.write_manifest(manifest_entries)
+
+            if self.resync_interval > 0:
+                # Keep the clone warm so periodic resyncs only fetch deltas
+                logger.info("Keeping git clone for periodic resync")
+            else:
+                # Clean up git clone to save space
+                self.cleanup_git_clone()
+
             return total_files
 
         except Exception as e:
             logger.error(f"Error during git data loading: {e}")
             return 0
     
+    def _bulk_copy_tar(self, transfers) -> bool:
+        """Stream the selected files to the shared volume via one tar pipe.
+
+        The clone's data/ layout matches the shared volume's, so
+        `tar -c` in the clone piped into `tar -x` in the target moves the
+        whole filtered batch with one fork/exec pair and kernel-buffered
+        pipe I/O instead of two Python-level syscalls per file. Returns
+        False on any failure so the caller can fall back to per-file copies.
+        """
+        data_root = os.path.join(self.git_clone_path, "data")
+        rel_paths = [os.path.relpath(src, data_root) for src, *_ in transfers]
+        try:
+            tar_out = subprocess.Popen(
+                ["tar", "-C", data_root, "-cf", "-", "--files-from=-"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            tar_in = subprocess.Popen(
+                ["tar", "-C", self.shared_data_path, "-xf", "-"],
+                stdin=tar_out.stdout)
+            tar_out.stdout.close()  # let tar_in see EOF when tar_out exits
+            tar_out.stdin.write("\n".join(rel_paths).encode())
+            tar_out.stdin.close()
+            if tar_in.wait(timeout=600) != 0 or tar_out.wait(timeout=600) != 0:
+                logger.warning("tar pipeline failed, falling back to per-file copy")
+                return False
+            logger.info(f"Bulk-copied {len(rel_paths)} files via tar pipeline")
+            return True
+        except Exception as e:
+            logger.warning(f"tar pipeline unavailable ({e}), falling back to per-file copy")
+            return False
+
+    def _transfer_file(self, source_file, target_file, same_fs):
+        """Hardlink the file when possible, otherwise fall back to a byte copy"""
+        if same_fs:
+            try:
+                if os.path.exists(target_file):
+                    os.remove(target_file)
+                os.link(source_file, target_file)
+                return
+            except OSError as e:
+                logger.debug(f"Hardlink failed for {source_file}, copying instead: {e}")
+        self._copy_bytes(source_file, target_file)
+
+    @staticmethod
+    def _copy_bytes(source_file, target_file):
+        """Copy file contents kernel-to-kernel via os.sendfile.
+
+        The shared volume is a scratch cache, so copy2's copystat pass
+        (extra stat/utime/chmod syscalls per file) buys nothing; sendfile
+        moves the bytes page-to-page inside the kernel with no userspace
+        buffer. Falls back to shutil.copyfile where sendfile does not
+        support file-to-file transfers.
+        """
+        with open(source_file, 'rb') as src, open(target_file, 'wb') as dst:
+            size = os.fstat(src.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (OSError, AttributeError):
+                if offset == 0:
+                    shutil.copyfileobj(src, dst)
+                else:
+                    raise
+
+    def resync(self) -> int:
+        """Refresh the warm clone and mirror only the changed H5 files.
+
+        A shallow fetch transfers just the new objects instead of a full
+        re-clone; diffing the old HEAD against FETCH_HEAD then yields
+        exactly the files that changed, so the shared volume is updated
+        with a handful of transfers rather than a full re-copy.
+        """
+        if not os.path.exists(os.path.join(self.git_clone_path, ".git")):
+            logger.warning("No warm git clone available for resync, skipping")
+            return 0
+
+        try:
+            result = subprocess.run(
+                ["git", "-C", self.git_clone_path, "fetch", "--depth=1", "origin", "HEAD"],
+                capture_output=True, text=True, timeout=300)
+            if result.returncode != 0:
+                logger.error(f"Git fetch failed during resync: {result.stderr}")
+                return 0
+
+            diff = subprocess.run(
+                ["git", "-C", self.git_clone_path, "diff", "--name-only", "HEAD", "FETCH_HEAD"],
+                capture_output=True, text=True, timeout=60)
+            if diff.returncode != 0:
+                logger.error(f"Git diff failed during resync: {diff.stderr}")
+                return 0
+
+            changed = [p for p in diff.stdout.splitlines() if p.endswith('.h5')]
+            if not changed:
+                logger.info("Resync: source repository unchanged")
+                return 0
+
+            result = subprocess.run(
+                ["git", "-C", self.git_clone_path, "reset", "--hard", "FETCH_HEAD"],
+                capture_output=True, text=True, timeout=300)
+            if result.returncode != 0:
+                logger.error(f"Git reset failed during resync: {result.stderr}")
+                return 0
+
+            same_fs = (os.stat(self.git_clone_path).st_dev
+                       == os.stat(self.shared_data_path).st_dev)
+            updated = 0
+            for rel_path in changed:
+                if not rel_path.startswith("data/"):
+                    # Cone-mode sparse checkout materializes repo-root files
+                    # too; anything outside data/ has no place in the volume
+                    continue
+                source_file = os.path.join(self.git_clone_path, rel_path)
+                if not os.path.exists(source_file):
+                    # Deleted upstream or outside the sparse-checkout set
+                    continue
+                target_file = os.path.join(self.shared_data_path,
+                                           rel_path[len("data/"):])
+                os.makedirs(os.path.dirname(target_file), exist_ok=True)
+                self._transfer_file(source_file, target_file, same_fs)
+                updated += 1
+
+            self._count_cache = None
+            # The server trusts the manifest over its own walk and keys its
+            # file-index cache on the .ready mtime, so both must be refreshed
+            # or the synced files stay invisible to it
+            self._rebuild_manifest()
+            self.signal_ready()
+            logger.info(f"Resync complete: {updated} files updated in shared volume")
+            return updated
+
+        except subprocess.TimeoutExpired:
+            logger.error("Git resync timed out")
+            return 0
+        except Exception as e:
+            logger.error(f"Error during resync: {e}")
+            return 0
+
+    def _resync_loop(self):
+        """Periodically pull source changes into the shared volume"""
+        while True:
+            time.sleep(self.resync_interval)
+            self.resync()
+
     def cleanup_git_clone(self):
         """Clean up git clone to save space"""
         try:
-            if os.path.exists(self.git_clone_path):
-                shutil.rmtree(self.git_clone_path)
-                logger.info("Cleaned up git clone directory")
+            # Rename is a single inode operation; the unlink walk over
+            # thousands of git objects then runs on a daemon thread so
+            # signal_ready is not held up behind it. EAFP: a missing clone
+            # surfaces as FileNotFoundError instead of a prior exists probe
+            trash_path = f"{self.git_clone_path}.trash.{os.getpid()}"
+            os.rename(self.git_clone_path, trash_path)
+        except FileNotFoundError:
+            return
         except Exception as e:
             logger.warning(f"Error cleaning up git clone: {e}")
+            return
+        threading.Thread(target=shutil.rmtree, args=(trash_path,),
+                         kwargs={'ignore_errors': True}, daemon=True).start()
+        logger.info("Git clone directory scheduled for background removal")
         
     def count_files_in_shared(self) -> int:
         """Count total files in shared volume for reporting"""
         total_files = 0
-        
+
         for machine in self.included_machines:
             machine_path = os.path.join(self.shared_data_path, machine)
             if os.path.exists(machine_path):
-                for root, dirs, files in os.walk(machine_path):
-                    total_files += len([f for f in files if f.endswith('.h5')])
-        
+                total_files += sum(1 for _ in _iter_h5(machine_path))
+
         return total_files
 
+    def _scan_shared(self) -> tuple:
+        """Answer 'any existing data?' and 'how many files?' in one walk.
+
+        run() needs both on the warm-start path; fusing them halves the
+        traversal versus check_existing_data followed by
+        count_files_in_shared. Returns (found, count).
+        """
+        try:
+            count = self.count_files_in_shared()
+        except Exception as e:
+            logger.error(f"Error scanning shared volume: {e}")
+            return (False, 0)
+        return (count > 0, count)
+
+    def _count_files_cached(self) -> int:
+        """Count files, reusing the last result while the tree is unchanged.
+
+        One stat() per machine directory replaces the recursive walk on the
+        common path (a static data set); any mtime change triggers a full
+        re-count.
+        """
+        mtimes = {}
+        for machine in self.included_machines:
+            machine_path = os.path.join(self.shared_data_path, machine)
+            try:
+                mtimes[machine] = os.stat(machine_path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[machine] = None
+
+        if self._count_cache is not None and self._count_cache[1] == mtimes:
+            return self._count_cache[0]
+
+        count = self.count_files_in_shared()
+        self._count_cache = (count, mtimes)
+        return count
+
+    def _rebuild_manifest(self):
+        """Regenerate the manifest from what is actually in the shared volume.
+
+        After a resync the copy-time manifest is stale (new files missing,
+        deleted files still listed), so the entries are rebuilt from a walk
+        of the machine trees.
+        """
+        entries = []
+        for machine in self.included_machines:
+            machine_path = os.path.join(self.shared_data_path, machine)
+            if not os.path.exists(machine_path):
+                continue
+            for path in _iter_h5(machine_path):
+                parts = os.path.relpath(path, self.shared_data_path).split(os.sep)
+                if len(parts) != 4:
+                    continue
+                _, operation, quality, filename = parts
+                entries.append({
+                    'path': path,
+                    'filename': filename,
+                    'machine': machine,
+                    'operation': operation,
+                    'quality': quality,
+                    'size': os.path.getsize(path),
+                })
+        self.write_manifest(entries)
+
+    def write_manifest(self, entries):
+        """Write the copied-file manifest so the server can skip its own walk"""
+        try:
+            manifest_file = os.path.join(self.shared_data_path, '.manifest.json')
+            with open(manifest_file, 'w') as f:
+                json.dump({'files': entries}, f)
+            logger.info(f"Wrote manifest with {len(entries)} entries")
+        except Exception as e:
+            logger.error(f"Error writing manifest: {e}")
+
+    def _on_demand_health_check(self, *_):
+        """SIGUSR1 handler: log the file count without any periodic polling.
+
+        Python runs signal handlers on the main thread between bytecodes,
+        so this fires even while the monitor loop is blocked in its inotify
+        read, and the cached count makes it a stat per machine directory
+        in the common case.
+        """
+        logger.info(f"Health check (on demand): {self._count_files_cached()} "
+                    f"files available in shared volume")
+
     def signal_ready(self):
         """Create ready file to signal completion to main container"""
         try:
@@ -192,10 +560,11 @@ class GitDataSidecar:
         logger.info(f"Git repository URL: {self.git_repo_url}")
         logger.info(f"Shared data path: {self.shared_data_path}")
         
-        # Check if data already exists
-        if self.check_existing_data():
+        # Check if data already exists; one walk yields both the answer and
+        # the file count
+        found, total_files = self._scan_shared()
+        if found:
             logger.info("Data already exists in shared volume, skipping git clone")
-            total_files = self.count_files_in_shared()
             logger.info(f"Found {total_files} existing files")
         else:
             logger.info("No existing data found in shared volume")
@@ -214,22 +583,80 @@ class GitDataSidecar:
         logger.info("Data setup complete! {} files ready in shared volume".format(total_files))
         logger.info("Main container can now discover and stream files directly")
         
+        # Periodic incremental resync against the warm clone, if enabled
+        if self.resync_interval > 0:
+            logger.info(f"Starting resync loop (every {self.resync_interval}s)...")
+            threading.Thread(target=self._resync_loop, daemon=True).start()
+
+        # On-demand health checks via `kill -USR1 <pid>`
+        try:
+            signal.signal(signal.SIGUSR1, self._on_demand_health_check)
+        except (ValueError, AttributeError):
+            # Not on the main thread, or platform without SIGUSR1
+            pass
+
         # Start monitoring loop
         logger.info("Starting monitoring loop...")
         self.monitor_loop()
 
     def monitor_loop(self):
         """Enhanced monitoring loop with periodic health checks"""
+        if INotify is not None:
+            self._monitor_inotify()
+        else:
+            self._monitor_polling()
+
+    def _monitor_inotify(self):
+        """Event-driven health loop.
+
+        The kernel reports .h5 creates/deletes, so the file count is updated
+        incrementally from the event payload and the tree is never re-walked
+        while quiescent. The read blocks without a timeout: the process
+        idles at zero CPU and wakes once per real filesystem event (or on
+        SIGUSR1 for an on-demand check, handled in run()).
+        """
+        count = self.count_files_in_shared()
+        mask = (inotify_flags.CREATE | inotify_flags.DELETE |
+                inotify_flags.MOVED_TO | inotify_flags.MOVED_FROM)
+        with INotify() as ino:
+            watches = {}
+
+            def add_watches(root):
+                for dirpath, dirnames, _ in os.walk(root):
+                    try:
+                        watches[ino.add_watch(dirpath, mask)] = dirpath
+                    except OSError as e:
+                        logger.debug(f"Could not watch {dirpath}: {e}")
+
+            add_watches(self.shared_data_path)
+
+            while True:
+                try:
+                    for event in ino.read():
+                        parent = watches.get(event.wd, self.shared_data_path)
+                        created = bool(event.mask & (inotify_flags.CREATE | inotify_flags.MOVED_TO))
+                        if event.mask & inotify_flags.ISDIR:
+                            if created:
+                                add_watches(os.path.join(parent, event.name))
+                        elif event.name.endswith('.h5'):
+                            count += 1 if created else -1
+                    logger.info(f"Health check: {count} files available in shared volume")
+                except Exception as e:
+                    logger.error(f"Error during health check: {e}")
+                    time.sleep(60)  # Wait 1 minute before retrying
+
+    def _monitor_polling(self):
+        """Polling health loop; fallback where inotify is unavailable."""
         while True:
             try:
-                current_files = self.count_files_in_shared()
+                current_files = self._count_files_cached()
                 logger.info(f"Health check: {current_files} files available in shared volume")
-                
+
                 # Check if source data has changed (could re-clone periodically)
                 # This could trigger re-sync if needed
-                
+
                 time.sleep(300)  # Check every 5 minutes
-                
+
             except Exception as e:
                 logger.error(f"Error during health check: {e}")
                 time.sleep(60)  # Wait 1 minute before retrying
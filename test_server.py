@@ -7,36 +7,120 @@ and data publishing functionality.
 """
 
 import asyncio
+import functools
+import io
 import pytest
 import pandas as pd
-import tempfile
-import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
-from asyncua import Server
 from asyncua.ua import VariantType
 
-# Import the functions to test
-from server import main, publish_sensor
+# Import the module and the functions to test; patch.object against these
+# bound references skips mock's per-patch string import resolution
+import server
+from server import load_sensor_data, main, publish_sensor
 
-
-class TestCSVDataLoading:
-    """Test cases for CSV data loading and processing."""
-
-    def setup_method(self):
-        """Set up test data for each test method."""
-        self.sample_csv_content = """Timestamp,Machine_ID,Temperature_C,Vibration_mm_s,Pressure_bar
+# Shared test data, built once at import time; tests only read it
+SAMPLE_CSV_CONTENT = """Timestamp,Machine_ID,Temperature_C,Vibration_mm_s,Pressure_bar
 24/1/24 0:00,Machine_1,62.12,2.51,5.98
 24/1/24 0:00,Machine_2,61.03,2.55,3.82
 24/1/24 1:00,Machine_1,63.45,2.48,6.12
 24/1/24 1:00,Machine_2,60.87,2.52,3.95"""
 
-    @patch('pandas.read_csv')
+# Timestamps parsed once at import; DataFrame constructions below slice these
+# instead of re-running pandas' string-parsing path each time
+_TS_PAIR = pd.to_datetime(['2024-01-24 00:00:00', '2024-01-24 01:00:00'])
+_TS_ONE = _TS_PAIR[:1]
+# First timestamp as a plain datetime, unboxed once instead of going
+# Series -> Timestamp -> datetime at each use
+_PY_TS_FIRST = _TS_PAIR[0].to_pydatetime()
+
+# Measurement columns every machine exposes, allocated once
+_MEASUREMENTS = ('Temperature_C', 'Vibration_mm_s', 'Pressure_bar')
+
+# Timestamp batches registered for _batch_lists; DataFrames are not hashable,
+# so the memoized helper is keyed on the integer timestamp instead
+_BATCHES = {}
+
+
+@functools.lru_cache(maxsize=128)
+def _batch_lists(batch_key):
+    """Memoized column-to-list conversion for a registered batch.
+
+    The publish loop replays the same timestamps every cycle, so the
+    tolist() conversions are computed once per unique key and served from
+    the cache on later passes.
+    """
+    batch = _BATCHES[batch_key]
+    return (batch['Temperature_C'].tolist(),
+            batch['Vibration_mm_s'].tolist(),
+            batch['Pressure_bar'].tolist())
+
+
+def _build_node_tree():
+    """Prewire the objects -> sensor -> variable mock chain used by tests.
+
+    One place builds the topology with plain AsyncMock leaves (no spec
+    reflection) instead of each test re-wiring the same six attributes.
+    """
+    objects = AsyncMock()
+    sensor = AsyncMock()
+    variable = AsyncMock()
+    objects.add_object = AsyncMock(return_value=sensor)
+    sensor.add_variable = AsyncMock(return_value=variable)
+    sensor.add_object = AsyncMock()
+    variable.set_writable = AsyncMock()
+    return SimpleNamespace(objects=objects, sensor=sensor, variable=variable)
+
+
+class _FakeServer:
+    """Minimal async stand-in for asyncua.Server.
+
+    AsyncMock(spec=Server) reflects over the whole Server class on every
+    instantiation; this stub exposes only the methods the tests touch and
+    records calls in a plain list.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.endpoint = "opc.tcp://0.0.0.0:4840/freeopcua/server/"
+        self.objects_node = AsyncMock()
+        self.start_error = None
+
+    async def init(self):
+        self.calls.append('init')
+
+    async def start(self):
+        self.calls.append('start')
+        if self.start_error is not None:
+            raise self.start_error
+
+    async def stop(self):
+        self.calls.append('stop')
+
+    async def register_namespace(self, uri):
+        self.calls.append(('register_namespace', uri))
+        return 1
+
+    def set_endpoint(self, url):
+        self.calls.append(('set_endpoint', url))
+
+    def get_objects_node(self):
+        return self.objects_node
+
+
+class TestCSVDataLoading:
+    """Test cases for CSV data loading and processing."""
+
+    @patch.object(pd, 'read_csv')
     def test_csv_loading_success(self, mock_read_csv):
         """Test successful CSV file loading."""
-        # Create mock DataFrame
+        # Create mock DataFrame shaped like the Arrow-engine read in main():
+        # timestamps arrive as strings and one vectorized to_datetime pass
+        # with an explicit format moves them into the index
         mock_df = pd.DataFrame({
-            'Timestamp': pd.to_datetime(['2024-01-24 00:00:00', '2024-01-24 01:00:00']),
+            'Timestamp': ['24/1/24 0:00', '24/1/24 1:00'],
             'Machine_ID': ['Machine_1', 'Machine_2'],
             'Temperature_C': [62.12, 61.03],
             'Vibration_mm_s': [2.51, 2.55],
@@ -45,14 +129,17 @@ class TestCSVDataLoading:
         mock_read_csv.return_value = mock_df
 
         # Test the CSV loading part of main function
-        with patch('server.Server'), \
-                patch('asyncio.run'):
+        with patch.object(server, 'Server'), \
+                patch.object(asyncio, 'run'):
             try:
                 # This will test the CSV loading part
-                df_sensor = pd.read_csv('sensor_data.csv', parse_dates=['Timestamp'])
+                df_sensor = pd.read_csv('sensor_data.csv', engine='pyarrow')
+                df_sensor.index = pd.to_datetime(df_sensor.pop('Timestamp'),
+                                                 format='%d/%m/%y %H:%M')
                 df_sensor['Machine_ID'] = df_sensor['Machine_ID'].astype(str)
 
                 assert not df_sensor.empty
+                assert df_sensor.index.name == 'Timestamp'
                 assert 'Machine_ID' in df_sensor.columns
                 assert 'Temperature_C' in df_sensor.columns
                 assert 'Vibration_mm_s' in df_sensor.columns
@@ -63,21 +150,30 @@ class TestCSVDataLoading:
 
     def test_csv_file_not_found(self):
         """Test handling of missing CSV file."""
-        with patch('pandas.read_csv', side_effect=FileNotFoundError("File not found")):
+        with patch.object(pd, 'read_csv', side_effect=FileNotFoundError("File not found")):
             with pytest.raises(FileNotFoundError):
                 pd.read_csv('nonexistent_file.csv', parse_dates=['Timestamp'])
 
+    def test_csv_chunked_loading(self):
+        """Test that chunked ingestion matches a whole-file read."""
+        full = pd.read_csv(io.StringIO(SAMPLE_CSV_CONTENT))
+        chunks = [full.iloc[i:i + 2] for i in range(0, len(full), 2)]
+
+        with patch.object(pd, 'read_csv', return_value=iter(chunks)):
+            streamed = load_sensor_data('sensor_data.csv', chunksize=2)
+
+        assert streamed.index.name == 'Timestamp'
+        assert len(streamed) == len(full)
+        assert streamed['Machine_ID'].tolist() == full['Machine_ID'].tolist()
+        assert streamed['Temperature_C'].tolist() == full['Temperature_C'].tolist()
+
     def test_csv_invalid_format(self):
         """Test handling of invalid CSV format."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("invalid,csv,format\n1,2")  # Missing expected columns
-            f.flush()
+        # StringIO goes through the same pandas parser with no disk roundtrip
+        buf = io.StringIO("invalid,csv,format\n1,2")  # Missing expected columns
 
-            try:
-                with pytest.raises((pd.errors.EmptyDataError, pd.errors.ParserError, ValueError)):
-                    pd.read_csv(f.name, parse_dates=['Timestamp'])
-            finally:
-                os.unlink(f.name)
+        with pytest.raises((pd.errors.EmptyDataError, pd.errors.ParserError, ValueError)):
+            pd.read_csv(buf, parse_dates=['Timestamp'])
 
 
 class TestOPCUAServerSetup:
@@ -85,68 +181,58 @@ class TestOPCUAServerSetup:
 
     @pytest.fixture
     def mock_server(self):
-        """Create a mock OPC UA server for testing."""
-        server = AsyncMock(spec=Server)
-        # Use synchronous get_objects_node so get_objects_node() is not a coroutine
-        objects_node = AsyncMock()
-        server.get_objects_node = Mock(return_value=objects_node)
-        server.register_namespace.return_value = 1
-        server.set_endpoint = Mock()
-        server.start = AsyncMock()
-        server.stop = AsyncMock()
-        server.endpoint = "opc.tcp://0.0.0.0:4840/freeopcua/server/"
-        return server
+        """Create a fake OPC UA server for testing."""
+        return _FakeServer()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_dataframe(self):
-        """Create sample DataFrame for testing."""
+        """Create sample DataFrame once per module; tests do not mutate it."""
         return pd.DataFrame({
-            'Timestamp': pd.to_datetime(['2024-01-24 00:00:00', '2024-01-24 01:00:00']),
-            'Machine_ID': ['Machine_1', 'Machine_2'],
+            'Timestamp': _TS_PAIR,
+            # category dtype: groupby/unique work on integer codes instead
+            # of walking Python string objects
+            'Machine_ID': pd.Categorical(['Machine_1', 'Machine_2']),
             'Temperature_C': [62.12, 61.03],
             'Vibration_mm_s': [2.51, 2.55],
             'Pressure_bar': [5.98, 3.82]
         })
 
-    @pytest.mark.asyncio
     async def test_server_initialization(self, mock_server):
         """Test OPC UA server initialization."""
-        with patch('server.Server', return_value=mock_server):
+        with patch.object(server, 'Server', return_value=mock_server):
             await mock_server.init()
             mock_server.set_endpoint("opc.tcp://0.0.0.0:4840/freeopcua/server/")
             idx = await mock_server.register_namespace("iot_sensors")
 
-            mock_server.init.assert_called_once()
-            mock_server.set_endpoint.assert_called_once_with("opc.tcp://0.0.0.0:4840/freeopcua/server/")
-            mock_server.register_namespace.assert_called_once_with("iot_sensors")
+            assert mock_server.calls == [
+                'init',
+                ('set_endpoint', "opc.tcp://0.0.0.0:4840/freeopcua/server/"),
+                ('register_namespace', "iot_sensors"),
+            ]
             assert idx == 1
 
-    @pytest.mark.asyncio
     async def test_node_creation(self, mock_server, sample_dataframe):
         """Test OPC UA node creation for sensors."""
+        tree = _build_node_tree()
+        mock_server.objects_node = tree.objects
         objects = mock_server.get_objects_node()
-        sensor_node = AsyncMock()
-        mock_server.get_objects_node.return_value = objects
-        objects.add_object = AsyncMock(return_value=sensor_node)
-        sensor_node.add_variable = AsyncMock()
-        sensor_node.add_object = AsyncMock()
-        variable_node = AsyncMock()
-        sensor_node.add_variable.return_value = variable_node
-        variable_node.set_writable = AsyncMock()
+        variable_node = tree.variable
 
         # Create root sensor node
         sensor_node = await objects.add_object(1, "Sensors")
 
         # Create timestamp variable
         ts_sensor = await sensor_node.add_variable(
-            1, "Timestamp_Sensor", sample_dataframe['Timestamp'].iloc[0].to_pydatetime()
+            1, "Timestamp_Sensor", _PY_TS_FIRST
         )
         await ts_sensor.set_writable()
 
-        # Create machine variables
-        for machine_id in sample_dataframe['Machine_ID'].unique():
+        # Create machine variables; groupby partitions the machines in one
+        # C-level pass instead of unique() plus per-key work
+        for machine_id, _group in sample_dataframe.groupby('Machine_ID', sort=False,
+                                                           observed=True):
             obj = await sensor_node.add_object(1, machine_id)
-            for measurement in ['Temperature_C', 'Vibration_mm_s', 'Pressure_bar']:
+            for measurement in _MEASUREMENTS:
                 var = await obj.add_variable(1, measurement, 0.0)
                 await var.set_writable()
 
@@ -176,18 +262,19 @@ class TestDataPublishing:
         vibration_sensor = AsyncMock()
         pressure_sensor = AsyncMock()
 
+        # Dispatch on the exact child name: one hash lookup per get_child
+        # call instead of a chain of substring scans
+        child_map = {
+            'Timestamp_Sensor': ts_sensor,
+            'Temperature_C': temp_sensor,
+            'Vibration_mm_s': vibration_sensor,
+            'Pressure_bar': pressure_sensor,
+        }
+
         def get_child_side_effect(path):
             name = path[0] if isinstance(path, list) else str(path)
-            if 'Timestamp_Sensor' in name:
-                return ts_sensor
-            elif 'Temperature_C' in name:
-                return temp_sensor
-            elif 'Vibration_mm_s' in name:
-                return vibration_sensor
-            elif 'Pressure_bar' in name:
-                return pressure_sensor
-            else:
-                return machine_obj
+            suffix = name.rsplit(':', 1)[-1]
+            return child_map.get(suffix, machine_obj)
 
         sensor_node.get_child.side_effect = get_child_side_effect
         machine_obj.get_child.side_effect = get_child_side_effect
@@ -201,18 +288,17 @@ class TestDataPublishing:
             'pressure_sensor': pressure_sensor
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_dataframe(self):
-        """Create sample DataFrame for testing."""
+        """Create sample DataFrame once per module; tests do not mutate it."""
         return pd.DataFrame({
-            'Timestamp': pd.to_datetime(['2024-01-24 00:00:00', '2024-01-24 01:00:00']),
-            'Machine_ID': ['Machine_1', 'Machine_1'],
+            'Timestamp': _TS_PAIR,
+            'Machine_ID': pd.Categorical(['Machine_1', 'Machine_1']),
             'Temperature_C': [62.12, 63.45],
             'Vibration_mm_s': [2.51, 2.48],
             'Pressure_bar': [5.98, 6.12]
         })
 
-    @pytest.mark.asyncio
     async def test_sensor_value_writing(self, mock_sensor_setup, sample_dataframe):
         """Test writing sensor values to OPC UA variables."""
         mocks = mock_sensor_setup
@@ -224,16 +310,14 @@ class TestDataPublishing:
         mocks['vibration_sensor'].write_value.assert_called_with(2.51)
         mocks['pressure_sensor'].write_value.assert_called_with(5.98)
 
-    @pytest.mark.asyncio
     async def test_timestamp_writing(self, mock_sensor_setup, sample_dataframe):
         """Test writing timestamp values."""
         mocks = mock_sensor_setup
-        timestamp = sample_dataframe['Timestamp'].iloc[0].to_pydatetime()
+        timestamp = _PY_TS_FIRST
         await mocks['ts_sensor'].write_value(timestamp, VariantType.DateTime)
 
         mocks['ts_sensor'].write_value.assert_called_with(timestamp, VariantType.DateTime)
 
-    @pytest.mark.asyncio
     async def test_publish_sensor_loop_iteration(self, mock_sensor_setup, sample_dataframe):
         """Test a single iteration of the publish sensor loop."""
         mocks = mock_sensor_setup
@@ -245,34 +329,46 @@ class TestDataPublishing:
         sensor_node = await objects.get_child([f"{idx}:Sensors"])
         ts_sensor = await sensor_node.get_child([f"{idx}:Timestamp_Sensor"])
 
-        # Prepare a single timestamp batch
-        timestamp = sample_dataframe['Timestamp'].iloc[0]
-        batch = sample_dataframe[sample_dataframe['Timestamp'] == timestamp]
+        # Prepare a single timestamp batch; groupby produces every batch in
+        # one sweep (matching publish_sensor) instead of a boolean-mask
+        # equality scan per timestamp
+        groups = sample_dataframe.groupby('Timestamp', sort=True)
+        timestamp, batch = next(iter(groups))
 
         await ts_sensor.write_value(timestamp.to_pydatetime(), VariantType.DateTime)
-        for _, row in batch.iterrows():
-            await mocks['temp_sensor'].write_value(float(row['Temperature_C']))
-            await mocks['vibration_sensor'].write_value(float(row['Vibration_mm_s']))
-            await mocks['pressure_sensor'].write_value(float(row['Pressure_bar']))
+        # Convert each column in one C-level pass through the memoized
+        # helper and dispatch the writes concurrently, mirroring how the
+        # server would bulk-write a batch instead of awaiting one value at
+        # a time. A replay of the same timestamp hits the cache
+        _batch_lists.cache_clear()
+        _BATCHES[timestamp.value] = batch
+        temps, vibs, pres = _batch_lists(timestamp.value)
+        assert _batch_lists(timestamp.value) == (temps, vibs, pres)
+        assert _batch_lists.cache_info().hits == 1
+        assert _batch_lists.cache_info().misses == 1
+        await asyncio.gather(
+            *[mocks['temp_sensor'].write_value(t) for t in temps],
+            *[mocks['vibration_sensor'].write_value(v) for v in vibs],
+            *[mocks['pressure_sensor'].write_value(p) for p in pres],
+        )
 
         ts_sensor.write_value.assert_called()
-        mocks['temp_sensor'].write_value.assert_called()
-        mocks['vibration_sensor'].write_value.assert_called()
-        mocks['pressure_sensor'].write_value.assert_called()
+        assert mocks['temp_sensor'].write_value.call_count == len(batch)
+        assert mocks['vibration_sensor'].write_value.call_count == len(batch)
+        assert mocks['pressure_sensor'].write_value.call_count == len(batch)
 
 
 class TestErrorHandling:
     """Test cases for error handling scenarios."""
 
-    @pytest.mark.asyncio
     async def test_server_start_failure(self):
         """Test handling of server start failure."""
-        mock_server = AsyncMock()
-        mock_server.start.side_effect = Exception("Failed to start server")
+        mock_server = _FakeServer()
+        mock_server.start_error = Exception("Failed to start server")
 
-        with patch('server.Server', return_value=mock_server), \
-                patch('pandas.read_csv', return_value=pd.DataFrame({
-                    'Timestamp': pd.to_datetime(['2024-01-24 00:00:00']),
+        with patch.object(server, 'Server', return_value=mock_server), \
+                patch.object(pd, 'read_csv', return_value=pd.DataFrame({
+                    'Timestamp': _TS_ONE,
                     'Machine_ID': ['Machine_1'],
                     'Temperature_C': [62.12],
                     'Vibration_mm_s': [2.51],
@@ -281,7 +377,6 @@ class TestErrorHandling:
             with pytest.raises(Exception, match="Failed to start server"):
                 await mock_server.start()
 
-    @pytest.mark.asyncio
     async def test_node_creation_failure(self):
         """Test handling of node creation failure."""
         mock_server = AsyncMock()
@@ -294,7 +389,6 @@ class TestErrorHandling:
             objects = mock_server.get_objects_node()
             await objects.add_object(1, "Sensors")
 
-    @pytest.mark.asyncio
     async def test_data_writing_failure(self):
         """Test handling of data writing failure."""
         mock_variable = AsyncMock()
@@ -307,31 +401,26 @@ class TestErrorHandling:
 class TestMainFunction:
     """Test cases for the main function integration."""
 
-    @pytest.mark.asyncio
     async def test_main_function_setup(self):
         """Test the main function setup process."""
+        # Shaped like the raw Arrow-engine read: timestamps still strings,
+        # main() converts them into the index itself
         sample_df = pd.DataFrame({
-            'Timestamp': pd.to_datetime(['2024-01-24 00:00:00']),
+            'Timestamp': ['24/1/24 0:00'],
             'Machine_ID': ['Machine_1'],
             'Temperature_C': [62.12],
             'Vibration_mm_s': [2.51],
             'Pressure_bar': [5.98]
         })
 
+        tree = _build_node_tree()
         mock_server = AsyncMock()
         mock_server.register_namespace.return_value = 1
-        mock_objects = AsyncMock()
-        mock_server.get_objects_node = Mock(return_value=mock_objects)
-        mock_sensor_node = AsyncMock()
-        mock_variable = AsyncMock()
-
-        mock_objects.add_object = AsyncMock(return_value=mock_sensor_node)
-        mock_sensor_node.add_variable = AsyncMock(return_value=mock_variable)
-        mock_sensor_node.add_object = AsyncMock()
+        mock_server.get_objects_node = Mock(return_value=tree.objects)
 
-        with patch('pandas.read_csv', return_value=sample_df), \
-                patch('server.Server', return_value=mock_server), \
-                patch('server.publish_sensor') as mock_publish:
+        with patch.object(pd, 'read_csv', return_value=sample_df), \
+                patch.object(server, 'Server', return_value=mock_server), \
+                patch.object(server, 'publish_sensor') as mock_publish:
             # Mock the publish_sensor to avoid infinite loop
             mock_publish.side_effect = KeyboardInterrupt("Test interrupt")
 
@@ -339,51 +428,45 @@ class TestMainFunction:
                 await main()
 
 
-class TestDataValidation:
-    """Test cases for data validation and edge cases."""
+# Edge-case frames for TestDataValidation, constructed once at import
+_EMPTY_DF = pd.DataFrame()
+_INCOMPLETE_DF = pd.DataFrame({
+    'Timestamp': _TS_ONE,
+    'Machine_ID': ['Machine_1']
+})
+_INVALID_DF = pd.DataFrame({
+    'Timestamp': _TS_ONE,
+    'Machine_ID': ['Machine_1'],
+    'Temperature_C': ['invalid_temperature'],  # String instead of float
+    'Vibration_mm_s': [2.51],
+    'Pressure_bar': [5.98]
+})
+_DUP_DF = pd.DataFrame({
+    'Timestamp': _TS_ONE.repeat(2),
+    'Machine_ID': ['Machine_1', 'Machine_1'],
+    'Temperature_C': [62.12, 63.45],
+    'Vibration_mm_s': [2.51, 2.48],
+    'Pressure_bar': [5.98, 6.12]
+})
 
-    def test_empty_dataframe(self):
-        """Test handling of empty DataFrame."""
-        empty_df = pd.DataFrame()
 
-        with pytest.raises((KeyError, IndexError)):
-            empty_df['Machine_ID'].unique()
-
-    def test_missing_columns(self):
-        """Test handling of DataFrame with missing required columns."""
-        incomplete_df = pd.DataFrame({
-            'Timestamp': pd.to_datetime(['2024-01-24 00:00:00']),
-            'Machine_ID': ['Machine_1']
-        })
-
-        with pytest.raises(KeyError):
-            float(incomplete_df['Temperature_C'].iloc[0])
-
-    def test_invalid_data_types(self):
-        """Test handling of invalid data types in DataFrame."""
-        invalid_df = pd.DataFrame({
-            'Timestamp': pd.to_datetime(['2024-01-24 00:00:00']),
-            'Machine_ID': ['Machine_1'],
-            'Temperature_C': ['invalid_temperature'],  # String instead of float
-            'Vibration_mm_s': [2.51],
-            'Pressure_bar': [5.98]
-        })
+class TestDataValidation:
+    """Test cases for data validation and edge cases."""
 
-        with pytest.raises((ValueError, TypeError)):
-            float(invalid_df['Temperature_C'].iloc[0])
+    @pytest.mark.parametrize('df, expected_exc, op', [
+        (_EMPTY_DF, (KeyError, IndexError), lambda df: df['Machine_ID'].unique()),
+        (_INCOMPLETE_DF, KeyError, lambda df: float(df['Temperature_C'].iloc[0])),
+        (_INVALID_DF, (ValueError, TypeError), lambda df: float(df['Temperature_C'].iloc[0])),
+    ], ids=['empty-dataframe', 'missing-columns', 'invalid-data-types'])
+    def test_malformed_dataframe(self, df, expected_exc, op):
+        """Test that malformed DataFrames raise when accessed like valid ones."""
+        with pytest.raises(expected_exc):
+            op(df)
 
     def test_duplicate_timestamps(self):
         """Test handling of duplicate timestamps for same machine."""
-        duplicate_df = pd.DataFrame({
-            'Timestamp': pd.to_datetime(['2024-01-24 00:00:00', '2024-01-24 00:00:00']),
-            'Machine_ID': ['Machine_1', 'Machine_1'],
-            'Temperature_C': [62.12, 63.45],
-            'Vibration_mm_s': [2.51, 2.48],
-            'Pressure_bar': [5.98, 6.12]
-        })
-
         # This should work - multiple rows for same timestamp/machine is valid
-        unique_timestamps = duplicate_df['Timestamp'].unique()
+        unique_timestamps = _DUP_DF['Timestamp'].unique()
         assert len(unique_timestamps) == 1
 
 